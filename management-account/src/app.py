@@ -1,187 +1,321 @@
 
 import json
-import boto3
+import logging
 import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+
+import boto3
+from botocore.config import Config
+
+# The Lambda runtime attaches a CloudWatch handler to the root logger
+logger = logging.getLogger()
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+# getLevelName maps known level names to their number; unknown names fall back to INFO
+logger.setLevel(LOG_LEVEL if isinstance(logging.getLevelName(LOG_LEVEL), int) else logging.INFO)
+
+# Shared client settings: room in the connection pool for the worker threads,
+# and adaptive retries that back off when STS or Secrets Manager throttle.
+# Attempts stay at the default 3 so one throttled call can't back off for long
+# enough to run the 60-second function timeout out before cleanup.
+BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"mode": "adaptive", "max_attempts": 3},
+    tcp_keepalive=True,
+)
 
 # Initialize AWS clients
-secretsmanager = boto3.client("secretsmanager")
-sts = boto3.client("sts")
-tagging = boto3.client("resourcegroupstaggingapi")
+secretsmanager = boto3.client("secretsmanager", config=BOTO_CONFIG)
+sts = boto3.client("sts", config=BOTO_CONFIG)
+tagging = boto3.client("resourcegroupstaggingapi", config=BOTO_CONFIG)
+
+# Shared session for target-account clients; loaded service models are reused across clients
+target_session = boto3.session.Session()
 
-# Get management account ID
-MANAGEMENT_ACCOUNT_ID = sts.get_caller_identity()["Account"]
+# Management account ID, taken from the invoked function's ARN by lambda_handler
+# so cold starts don't pay for a GetCallerIdentity call
+MANAGEMENT_ACCOUNT_ID = None
 
 # --- Constants ---
 CONFIG_SECRET_ID = "secret-sync/config"
 ROLE_TO_ASSUME = "SecretSyncRole"
+# Distinct role session names per phase, so target-account CloudTrail can tell them apart
+SYNC_SESSION_NAME = "SecretSyncSession"
+DELETION_SESSION_NAME = "SecretSyncDeletionSession"
+CLEANUP_SESSION_NAME = "SecretSyncCleanupSession"
+DEFAULT_MAX_WORKERS = 16  # Cross-account calls are I/O-bound, so a wide pool pays off
+try:
+    MAX_WORKERS = max(1, int(os.environ.get("SECRET_SYNC_WORKERS", DEFAULT_MAX_WORKERS)))
+except ValueError:
+    logger.warning("Invalid SECRET_SYNC_WORKERS value %r, using %s.", os.environ["SECRET_SYNC_WORKERS"], DEFAULT_MAX_WORKERS)
+    MAX_WORKERS = DEFAULT_MAX_WORKERS
+ASSUME_ROLE_DURATION_SECONDS = 3600
+CREDENTIALS_REFRESH_MARGIN = timedelta(minutes=5)  # Refresh early so in-flight calls never use an expired session
+BATCH_GET_SECRET_VALUE_LIMIT = 20  # Maximum number of secrets per BatchGetSecretValue call
+LIST_SECRETS_PAGE_SIZE = 100  # Maximum page size accepted by ListSecrets
+GET_RESOURCES_PAGE_SIZE = 100  # Maximum ResourcesPerPage accepted by GetResources
+ORPHAN_DELETE_WORKERS = 8  # Per-account pool for deleting orphans, nested inside the cleanup pool
+CONFIG_CACHE_TTL_SECONDS = 300
 
 # Tag Keys
 TAG_SYNC_GROUP = "SecretSync-SyncDestinationGroup"
 TAG_SYNC_ACCOUNT = "SecretSync-SyncAccount"
 TAG_NO_SYNC_GROUP = "SecretSync-NoSyncDestinationGroup"
 TAG_NO_SYNC_ACCOUNT = "SecretSync-NoSyncAccount"
-SYNC_TAG_KEYS = [TAG_SYNC_GROUP, TAG_SYNC_ACCOUNT, TAG_NO_SYNC_GROUP, TAG_NO_SYNC_ACCOUNT]
+SYNC_TAG_KEYS = frozenset({TAG_SYNC_GROUP, TAG_SYNC_ACCOUNT, TAG_NO_SYNC_GROUP, TAG_NO_SYNC_ACCOUNT})
+GROUP_TAG_KEYS = frozenset({TAG_SYNC_GROUP, TAG_NO_SYNC_GROUP})
+
+# --- Caches ---
+# Module globals survive warm invocations, so the parsed configuration, assumed
+# credentials and the clients built from them are reused until they expire.
+_config_cache = {"value": None, "expires_at": 0}
+_credentials_cache = {}  # (account_id, session_name) -> STS Credentials
+_client_cache = {}  # (account_id, region, session_name) -> (AccessKeyId, client)
+_cache_lock = threading.Lock()
+_account_locks = {}  # (account_id, session_name) -> lock, so concurrent workers assume each role only once
+
+def get_config():
+    """Retrieves and parses the configuration from Secrets Manager, caching it for warm invocations."""
+    if _config_cache["value"] is not None and time.time() < _config_cache["expires_at"]:
+        logger.info("Using cached configuration.")
+        return _config_cache["value"]
 
-def get_config(required=True):
-    """Retrieves and parses the configuration from Secrets Manager."""
     try:
         response = secretsmanager.get_secret_value(SecretId=CONFIG_SECRET_ID)
         config = json.loads(response["SecretString"])
-        print("Successfully loaded configuration.")
+        config["AccountGroups"] = normalize_account_groups(config)
+        _config_cache["value"] = config
+        _config_cache["expires_at"] = time.time() + CONFIG_CACHE_TTL_SECONDS
+        logger.info("Successfully loaded configuration.")
         return config
     except secretsmanager.exceptions.ResourceNotFoundException:
-        if required:
-            print(f"FATAL: Configuration secret {CONFIG_SECRET_ID} not found. This is required when using group-based tags.")
-            raise
-        else:
-            print(f"Configuration secret {CONFIG_SECRET_ID} not found. Using individual account tags only.")
-            return None
+        logger.info("Configuration secret %s not found. Using individual account tags only.", CONFIG_SECRET_ID)
+        return None
     except json.JSONDecodeError as e:
-        print(f"FATAL: Could not parse configuration secret {CONFIG_SECRET_ID} as JSON. Error: {e}")
+        logger.error("FATAL: Could not parse configuration secret %s as JSON. Error: %s", CONFIG_SECRET_ID, e)
         raise
     except Exception as e:
-        print(f"FATAL: Could not retrieve configuration secret {CONFIG_SECRET_ID}. Error: {e}")
+        logger.error("FATAL: Could not retrieve configuration secret %s. Error: %s", CONFIG_SECRET_ID, e)
         raise
 
-def get_secrets_to_process():
-    """Finds all secrets that have at least one of our sync tags."""
-    print("Searching for all secrets to find resources to process...")
+def normalize_account_groups(config):
+    """
+    Converts every AccountGroups entry to {"Accounts", "Region", "DeleteSync", "Targets"} once,
+    so per-secret resolution doesn't have to handle both group formats.
+    "Accounts" is a frozenset for exclusions; "Targets" holds the group's
+    precomputed (account_id, (region, delete_sync)) pairs in config order.
+    """
+    global_delete_sync = config.get("DeleteSync", True)
+    account_groups = {}
+    for name, group_info in config.get("AccountGroups", {}).items():
+        # Handle both old format (list) and new format (dict)
+        if isinstance(group_info, list):
+            group = {"Accounts": group_info, "Region": None, "DeleteSync": global_delete_sync}
+        else:
+            group = {
+                "Accounts": group_info.get("Accounts", []),
+                "Region": group_info.get("Region"),
+                "DeleteSync": group_info.get("DeleteSync", global_delete_sync),
+            }
+        target = (group["Region"], group["DeleteSync"])
+        group["Targets"] = tuple((account, target) for account in group["Accounts"])
+        group["Accounts"] = frozenset(group["Accounts"])
+        account_groups[name] = group
+    return account_groups
+
+def get_secrets_to_process(tag_keys):
+    """Yields every secret that has at least one of the given tag keys, streaming pages as they arrive."""
+    logger.info("Searching for secrets with sync-related tags...")
     paginator = tagging.get_paginator("get_resources")
-    pages = paginator.paginate(ResourceTypeFilters=["secretsmanager:secret"])
     
-    secrets_to_process = []
-    for page in pages:
-        for resource in page.get("ResourceTagMappingList", []):
-            if any(tag['Key'] in SYNC_TAG_KEYS for tag in resource.get("Tags", [])):
-                secrets_to_process.append(resource)
+    # Multiple TagFilters are ANDed by the tagging API, so query once per tag key
+    # and skip ARNs already yielded to get every secret carrying any of them.
+    seen_arns = set()
+    for tag_key in tag_keys:
+        pages = paginator.paginate(
+            ResourceTypeFilters=["secretsmanager:secret"],
+            TagFilters=[{"Key": tag_key}],
+            PaginationConfig={"PageSize": GET_RESOURCES_PAGE_SIZE}
+        )
+        for page in pages:
+            for resource in page.get("ResourceTagMappingList", []):
+                if resource["ResourceARN"] not in seen_arns:
+                    seen_arns.add(resource["ResourceARN"])
+                    yield resource
             
-    print(f"Found {len(secrets_to_process)} secrets with sync-related tags.")
-    return secrets_to_process
+    logger.info("Found %s secrets with sync-related tags.", len(seen_arns))
 
-def resolve_sync_targets(tags, config):
+def fetch_secret_values(secret_arns):
+    """
+    Fetches source secret values in batches, returning {arn: (name, secret_payload)}.
+    The payload is {"SecretString": ...} or {"SecretBinary": ...} and can be passed
+    straight to put_secret_value/create_secret.
+    Secrets whose value cannot be read (e.g. marked for deletion) are left out.
+    """
+    secret_values = {}
+    for start in range(0, len(secret_arns), BATCH_GET_SECRET_VALUE_LIMIT):
+        chunk = secret_arns[start:start + BATCH_GET_SECRET_VALUE_LIMIT]
+        try:
+            response = secretsmanager.batch_get_secret_value(SecretIdList=chunk)
+        except Exception as e:
+            logger.error("ERROR: Could not fetch values for %s secret(s). Error: %s", len(chunk), e)
+            continue
+        for secret in response.get("SecretValues", []):
+            if secret.get("SecretBinary") is not None:
+                secret_payload = {"SecretBinary": secret["SecretBinary"]}
+            elif secret.get("SecretString") is not None:
+                secret_payload = {"SecretString": secret["SecretString"]}
+            else:
+                logger.warning("Could not fetch value for secret %s: it has neither a SecretString nor a SecretBinary.", secret.get("ARN"))
+                continue
+            secret_values[secret["ARN"]] = (secret["Name"], secret_payload)
+        for error in response.get("Errors", []):
+            logger.warning("Could not fetch value for secret %s: %s %s", error.get('SecretId'), error.get('ErrorCode'), error.get('Message'))
+    return secret_values
+
+def _handle_no_sync_group(value, sync_targets, exclude_set, account_groups, global_delete_sync):
+    group = account_groups.get(value)
+    if group is not None:
+        exclude_set.update(group["Accounts"])
+
+def _handle_no_sync_account(value, sync_targets, exclude_set, account_groups, global_delete_sync):
+    exclude_set.add(value)
+
+def _handle_sync_account(value, sync_targets, exclude_set, account_groups, global_delete_sync):
+    if value not in exclude_set:
+        sync_targets[value] = (None, global_delete_sync) # Individual accounts use global setting
+
+def _handle_sync_group(value, sync_targets, exclude_set, account_groups, global_delete_sync):
+    group = account_groups.get(value)
+    if group is None:
+        return
+    if exclude_set:
+        sync_targets.update(target for target in group["Targets"] if target[0] not in exclude_set)
+    else:
+        sync_targets.update(group["Targets"])
+
+# Handlers run in this order. Exclusions come first so inclusions can skip excluded
+# accounts outright. When a group and an account tag include the same account
+# with different settings, the group's region and DeleteSync win.
+TAG_HANDLERS = {
+    TAG_NO_SYNC_GROUP: _handle_no_sync_group,
+    TAG_NO_SYNC_ACCOUNT: _handle_no_sync_account,
+    TAG_SYNC_ACCOUNT: _handle_sync_account,
+    TAG_SYNC_GROUP: _handle_sync_group,
+}
+
+def resolve_sync_targets(tags, account_groups, global_delete_sync):
     """
     Calculates the final list of (account_id, region, delete_sync) targets.
+    account_groups must already be normalized by normalize_account_groups.
     """
     sync_targets = {}  # Using a dict to ensure one entry per account, mapping account_id -> (region, delete_sync)
     exclude_set = set()
-    account_groups = config.get("AccountGroups", {}) if config else {}
-    global_delete_sync = config.get("DeleteSync", True) if config else True
-    never_delete = config.get("NeverDelete", False) if config else False
 
-    # Check for group-based tags when config is missing
-    group_tags = [tag for tag in tags if tag.get("Key") in [TAG_SYNC_GROUP, TAG_NO_SYNC_GROUP]]
-    if group_tags and not config:
-        raise ValueError(f"Configuration secret {CONFIG_SECRET_ID} is required when using group-based tags: {[tag.get('Key') for tag in group_tags]}")
-
-    # Inclusion Pass
-    for tag in tags:
-        key, value = tag.get("Key"), tag.get("Value")
-        if key == TAG_SYNC_GROUP:
-            group_info = account_groups.get(value, {})
-            # Handle both old format (list) and new format (dict)
-            accounts = group_info if isinstance(group_info, list) else group_info.get("Accounts", [])
-            region = group_info.get("Region") if isinstance(group_info, dict) else None
-            delete_sync = group_info.get("DeleteSync", global_delete_sync) if isinstance(group_info, dict) else global_delete_sync
-            for account in accounts:
-                sync_targets[account] = (region, delete_sync)
-        elif key == TAG_SYNC_ACCOUNT:
-            sync_targets[value] = (None, global_delete_sync) # Individual accounts use global setting
-
-    # Exclusion Pass
-    for tag in tags:
-        key, value = tag.get("Key"), tag.get("Value")
-        if key == TAG_NO_SYNC_GROUP:
-            group_info = account_groups.get(value, {})
-            accounts = group_info if isinstance(group_info, list) else group_info.get("Accounts", [])
-            exclude_set.update(accounts)
-        elif key == TAG_NO_SYNC_ACCOUNT:
-            exclude_set.add(value)
-
-    # Final Calculation
-    final_targets = {acc: (region, delete_sync) for acc, (region, delete_sync) in sync_targets.items() if acc not in exclude_set}
-    return [(acc, region, delete_sync) for acc, (region, delete_sync) in final_targets.items()]
-
-
-def sync_to_single_account(account_id, region, secret_name, secret_value, delete_sync=True):
-    """Assumes a role in a target account and creates/updates the secret in the specified region."""
-    region_str = region if region else "the default region"
-    print(f"  -> Syncing to account {account_id} in {region_str} as secret '{secret_name}'...")
-    try:
+    # Tag keys are unique per resource, so index them once and look up only our four keys
+    tag_map = {tag["Key"]: tag["Value"] for tag in tags}
+
+    for key, handler in TAG_HANDLERS.items():
+        value = tag_map.get(key)
+        if value is not None:
+            handler(value, sync_targets, exclude_set, account_groups, global_delete_sync)
+
+    return [(acc, region, delete_sync) for acc, (region, delete_sync) in sync_targets.items()]
+
+
+def get_assumed_credentials(account_id, session_name=SYNC_SESSION_NAME):
+    """Returns credentials for the sync role in the target account, assuming it only when the cached ones are near expiry."""
+    cache_key = (account_id, session_name)
+    with _cache_lock:
+        account_lock = _account_locks.setdefault(cache_key, threading.Lock())
+
+    with account_lock:
+        credentials = _credentials_cache.get(cache_key)
+        if credentials and datetime.now(timezone.utc) + CREDENTIALS_REFRESH_MARGIN < credentials["Expiration"]:
+            return credentials
+
         assumed_role = sts.assume_role(
             RoleArn=f"arn:aws:iam::{account_id}:role/{ROLE_TO_ASSUME}",
-            RoleSessionName="SecretSyncSession"
+            RoleSessionName=session_name,
+            DurationSeconds=ASSUME_ROLE_DURATION_SECONDS
         )
         credentials = assumed_role["Credentials"]
-        
-        target_sm_client = boto3.client(
+        _credentials_cache[cache_key] = credentials
+        return credentials
+
+def get_target_client(account_id, region=None, session_name=SYNC_SESSION_NAME):
+    """Returns a Secrets Manager client for the target account, reused for as long as its credentials are valid."""
+    credentials = get_assumed_credentials(account_id, session_name)
+    # Sessions are not thread-safe, so clients are built under the cache lock
+    with _cache_lock:
+        cached = _client_cache.get((account_id, region, session_name))
+        if cached and cached[0] == credentials["AccessKeyId"]:
+            return cached[1]
+
+        target_sm_client = target_session.client(
             "secretsmanager",
             region_name=region,
             aws_access_key_id=credentials["AccessKeyId"],
             aws_secret_access_key=credentials["SecretAccessKey"],
             aws_session_token=credentials["SessionToken"],
+            config=BOTO_CONFIG,
         )
+        _client_cache[(account_id, region, session_name)] = (credentials["AccessKeyId"], target_sm_client)
+        return target_sm_client
+
+def sync_to_single_account(account_id, region, secret_name, secret_payload, delete_sync=True):
+    """Assumes a role in a target account and creates/updates the secret in the specified region."""
+    region_str = region if region else "the default region"
+    logger.info("  -> Syncing to account %s in %s as secret '%s'...", account_id, region_str, secret_name)
+    try:
+        target_sm_client = get_target_client(account_id, region)
 
         try:
-            secret_info = target_sm_client.describe_secret(SecretId=secret_name)
-            
-            # Check if target secret is marked for deletion
-            if secret_info.get("DeletedDate"):
-                if delete_sync:
-                    print(f"     Secret '{secret_name}' is marked for deletion, restoring it first.")
-                    target_sm_client.restore_secret(SecretId=secret_name)
-                    print(f"     Restored secret '{secret_name}' from deletion.")
-                else:
-                    print(f"     Secret '{secret_name}' is marked for deletion, but DeleteSync is disabled. Skipping sync.")
+            # Write first: the common case is an existing secret, which needs a single call
+            try:
+                target_sm_client.put_secret_value(SecretId=secret_name, **secret_payload)
+            except target_sm_client.exceptions.InvalidRequestException:
+                # A secret marked for deletion rejects new values; anything else is a real error
+                if not target_sm_client.describe_secret(SecretId=secret_name).get("DeletedDate"):
+                    raise
+                if not delete_sync:
+                    logger.info("     Secret '%s' is marked for deletion, but DeleteSync is disabled. Skipping sync.", secret_name)
                     return
+                logger.info("     Secret '%s' is marked for deletion, restoring it first.", secret_name)
+                target_sm_client.restore_secret(SecretId=secret_name)
+                logger.info("     Restored secret '%s' from deletion.", secret_name)
+                target_sm_client.put_secret_value(SecretId=secret_name, **secret_payload)
             
-            print(f"     Secret '{secret_name}' exists. Updating value.")
-            target_sm_client.put_secret_value(SecretId=secret_name, SecretString=secret_value)
-            
-            # Add management tag to existing secret
-            target_sm_client.tag_resource(
-                SecretId=secret_info["ARN"],
-                Tags=[{"Key": "SyncedFrom", "Value": MANAGEMENT_ACCOUNT_ID}]
-            )
-            print(f"     Successfully updated secret '{secret_name}' in account {account_id}.")
+            # The SyncedFrom tag is written once, when the secret is created
+            logger.info("     Successfully updated secret '%s' in account %s.", secret_name, account_id)
         except target_sm_client.exceptions.ResourceNotFoundException:
-            print(f"     Secret '{secret_name}' not found. Creating it.")
-            response = target_sm_client.create_secret(
+            logger.info("     Secret '%s' not found. Creating it.", secret_name)
+            target_sm_client.create_secret(
                 Name=secret_name, 
-                SecretString=secret_value,
+                **secret_payload,
                 Tags=[{"Key": "SyncedFrom", "Value": MANAGEMENT_ACCOUNT_ID}]
             )
-            print(f"     Successfully created secret '{secret_name}' in account {account_id}.")
+            logger.info("     Successfully created secret '%s' in account %s.", secret_name, account_id)
 
     except Exception as e:
-        print(f"     ERROR: Failed to sync to account {account_id} in region {region}. Error: {e}")
+        logger.error("     ERROR: Failed to sync to account %s in region %s. Error: %s", account_id, region, e)
 
 def mark_secret_for_deletion(account_id, region, secret_name, source_describe_response, never_delete=False):
     """Mark secret for deletion in target account with same settings as source."""
     region_str = region if region else "the default region"
-    print(f"  -> Marking secret '{secret_name}' for deletion in account {account_id} in {region_str}...")
+    logger.info("  -> Marking secret '%s' for deletion in account %s in %s...", secret_name, account_id, region_str)
     try:
-        assumed_role = sts.assume_role(
-            RoleArn=f"arn:aws:iam::{account_id}:role/{ROLE_TO_ASSUME}",
-            RoleSessionName="SecretSyncDeletionSession"
-        )
-        credentials = assumed_role["Credentials"]
-        
-        target_sm_client = boto3.client(
-            "secretsmanager",
-            region_name=region,
-            aws_access_key_id=credentials["AccessKeyId"],
-            aws_secret_access_key=credentials["SecretAccessKey"],
-            aws_session_token=credentials["SessionToken"],
-        )
+        target_sm_client = get_target_client(account_id, region, DELETION_SESSION_NAME)
 
+        # No existence probe: delete_secret raises ResourceNotFoundException itself
         try:
-            # Check if target secret exists
-            target_sm_client.describe_secret(SecretId=secret_name)
-            
             if never_delete:
                 # Safety mode: always use 7-day recovery window
                 recovery_window = 7
-                print(f"     NeverDelete enabled: using 7-day recovery window")
+                logger.info("     NeverDelete enabled: using 7-day recovery window")
             else:
                 # Calculate recovery window from source secret
                 deletion_date = source_describe_response.get("DeletionDate")
@@ -199,136 +333,187 @@ def mark_secret_for_deletion(account_id, region, secret_name, source_describe_re
                 SecretId=secret_name,
                 RecoveryWindowInDays=recovery_window
             )
-            print(f"     Successfully marked secret '{secret_name}' for deletion with {recovery_window} day recovery window.")
+            logger.info("     Successfully marked secret '%s' for deletion with %s day recovery window.", secret_name, recovery_window)
                 
         except target_sm_client.exceptions.ResourceNotFoundException:
-            print(f"     Secret '{secret_name}' not found in target account, nothing to delete.")
+            logger.info("     Secret '%s' not found in target account, nothing to delete.", secret_name)
 
     except Exception as e:
-        print(f"     ERROR: Failed to mark secret for deletion in account {account_id}: {e}")
+        logger.error("     ERROR: Failed to mark secret for deletion in account %s: %s", account_id, e)
+
+def delete_orphaned_secret(account_id, target_sm_client, secret_name, never_delete=False):
+    """Deletes a single orphaned secret from a target account."""
+    logger.info("  -> Deleting orphaned secret '%s' from account %s", secret_name, account_id)
+    try:
+        if never_delete:
+            # Safety mode: use 7-day recovery window
+            target_sm_client.delete_secret(SecretId=secret_name, RecoveryWindowInDays=7)
+            logger.info("     Successfully marked orphaned secret '%s' for deletion with 7-day recovery window (NeverDelete enabled)", secret_name)
+        else:
+            # Normal mode: immediate deletion
+            target_sm_client.delete_secret(SecretId=secret_name, ForceDeleteWithoutRecovery=True)
+            logger.info("     Successfully deleted orphaned secret '%s'", secret_name)
+    except Exception as e:
+        logger.error("     ERROR: Failed to delete secret '%s': %s", secret_name, e)
 
 def cleanup_orphaned_secrets(account_id, managed_secrets, never_delete=False):
     """Remove secrets in target account that are no longer managed by this tool."""
-    print(f"Cleaning up orphaned secrets in account {account_id}...")
+    logger.info("Cleaning up orphaned secrets in account %s...", account_id)
     try:
-        assumed_role = sts.assume_role(
-            RoleArn=f"arn:aws:iam::{account_id}:role/{ROLE_TO_ASSUME}",
-            RoleSessionName="SecretSyncCleanupSession"
-        )
-        credentials = assumed_role["Credentials"]
-        
-        target_sm_client = boto3.client(
-            "secretsmanager",
-            aws_access_key_id=credentials["AccessKeyId"],
-            aws_secret_access_key=credentials["SecretAccessKey"],
-            aws_session_token=credentials["SessionToken"],
-        )
+        target_sm_client = get_target_client(account_id, session_name=CLEANUP_SESSION_NAME)
 
-        # List all secrets managed by us
-        response = target_sm_client.list_secrets(
+        # List all secrets managed by us. Orphans are collected across every page
+        # before deleting, so removals can't shift the pages still to be read.
+        paginator = target_sm_client.get_paginator("list_secrets")
+        pages = paginator.paginate(
             Filters=[
                 {"Key": "tag-key", "Values": ["SyncedFrom"]},
                 {"Key": "tag-value", "Values": [MANAGEMENT_ACCOUNT_ID]}
-            ]
+            ],
+            PaginationConfig={"PageSize": LIST_SECRETS_PAGE_SIZE}
         )
+        orphaned_secrets = [
+            secret["Name"]
+            for page in pages
+            for secret in page.get("SecretList", [])
+            if secret["Name"] not in managed_secrets
+        ]
         
-        for secret in response.get("SecretList", []):
-            secret_name = secret["Name"]
-            if secret_name not in managed_secrets:
-                print(f"  -> Deleting orphaned secret '{secret_name}' from account {account_id}")
-                try:
-                    if never_delete:
-                        # Safety mode: use 7-day recovery window
-                        target_sm_client.delete_secret(SecretId=secret_name, RecoveryWindowInDays=7)
-                        print(f"     Successfully marked orphaned secret '{secret_name}' for deletion with 7-day recovery window (NeverDelete enabled)")
-                    else:
-                        # Normal mode: immediate deletion
-                        target_sm_client.delete_secret(SecretId=secret_name, ForceDeleteWithoutRecovery=True)
-                        print(f"     Successfully deleted orphaned secret '{secret_name}'")
-                except Exception as e:
-                    print(f"     ERROR: Failed to delete secret '{secret_name}': {e}")
+        run_in_parallel(
+            delete_orphaned_secret,
+            [(account_id, target_sm_client, secret_name, never_delete) for secret_name in orphaned_secrets],
+            max_workers=ORPHAN_DELETE_WORKERS
+        )
 
     except Exception as e:
-        print(f"ERROR: Failed to cleanup account {account_id}. Error: {e}")
+        logger.error("ERROR: Failed to cleanup account %s. Error: %s", account_id, e)
+
+def run_in_parallel(func, tasks, max_workers=MAX_WORKERS):
+    """Runs func(*task) for every task on a thread pool, so one failure never cancels its siblings."""
+    if not tasks:
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        futures = {executor.submit(func, *task): task for task in tasks}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("ERROR: %s failed for %s. Error: %s", func.__name__, futures[future][0], e)
 
 def lambda_handler(event, context):
     """Main function for the Lambda."""
-    secrets_to_process = get_secrets_to_process()
-    
-    # Check if any secrets use group-based tags
-    group_based_tags = [TAG_SYNC_GROUP, TAG_NO_SYNC_GROUP]
-    config_required = False
-    
-    for resource in secrets_to_process:
-        tags = resource.get("Tags", [])
-        if any(tag.get("Key") in group_based_tags for tag in tags):
-            config_required = True
-            break
-    
-    # Only load config if needed
-    config = get_config(required=config_required)
+    global MANAGEMENT_ACCOUNT_ID
+    MANAGEMENT_ACCOUNT_ID = context.invoked_function_arn.split(":")[4]
+
+    # Load config up front so tagged secrets can be processed as they are found.
+    # Secrets using group-based tags without a config abort the run below.
+    config = get_config()
     
     # Track which secrets should exist in each target account
-    target_accounts = set()
-    managed_secrets_per_account = {}
+    managed_secrets_per_account = defaultdict(set)
     delete_sync_per_account = {}
+    # Accounts targeted by a secret whose name could not be read; their cleanup is
+    # skipped because its copy would look like an orphan
+    incomplete_accounts = set()
+    # Global settings are read once per invocation rather than once per secret
+    account_groups = config["AccountGroups"] if config else {}
+    global_delete_sync = config.get("DeleteSync", True) if config else True
     never_delete = config.get("NeverDelete", False) if config else False
 
-    for resource in secrets_to_process:
+    # Work is collected per secret and fanned out afterwards
+    sync_tasks = []
+    deletion_tasks = []
+
+    # Resolve targets first so only secrets that will actually be synced are fetched
+    secrets_with_targets = []
+    resolved_targets = {}  # sync tag pairs -> targets, as many secrets share the same tags
+    # Only inclusion tags can produce targets, so secrets are found by those alone;
+    # their exclusion tags come back with them. The group tag is queried even without
+    # a config, so group-only secrets still trigger the missing-config check below.
+    for resource in get_secrets_to_process((TAG_SYNC_ACCOUNT, TAG_SYNC_GROUP)):
         secret_arn = resource["ResourceARN"]
         tags = resource.get("Tags", [])
+
+        # Group-based tags cannot be resolved without the configuration secret. Abort
+        # before any sync or cleanup, otherwise the copies synced through the group
+        # would look like orphans to cleanup and be deleted.
+        if not config:
+            group_tag_keys = sorted(GROUP_TAG_KEYS.intersection(tag["Key"] for tag in tags))
+            if group_tag_keys:
+                logger.error("FATAL: Configuration secret %s not found. This is required when using group-based tags: secret %s uses %s.", CONFIG_SECRET_ID, secret_arn, group_tag_keys)
+                raise ValueError(f"Configuration secret {CONFIG_SECRET_ID} is required when using group-based tags: {group_tag_keys}")
         
         try:
-            sync_targets = resolve_sync_targets(tags, config)
+            sync_tag_pairs = tuple((tag["Key"], tag["Value"]) for tag in tags if tag["Key"] in SYNC_TAG_KEYS)
+            if sync_tag_pairs not in resolved_targets:
+                resolved_targets[sync_tag_pairs] = resolve_sync_targets(tags, account_groups, global_delete_sync)
+            sync_targets = resolved_targets[sync_tag_pairs]
 
             if not sync_targets:
-                print(f"Skipping secret {secret_arn}: no target accounts after calculating rules.")
+                logger.info("Skipping secret %s: no target accounts after calculating rules.", secret_arn)
                 continue
 
-            print(f"Processing secret {secret_arn} for {len(sync_targets)} target(s).")
+            logger.info("Processing secret %s for %s target(s).", secret_arn, len(sync_targets))
+            secrets_with_targets.append((secret_arn, sync_targets))
 
-            describe_response = secretsmanager.describe_secret(SecretId=secret_arn)
-            secret_name = describe_response["Name"]
-            
-            # Check if secret is marked for deletion
-            if describe_response.get("DeletedDate"):
-                print(f"Secret '{secret_name}' is marked for deletion, syncing deletion state to targets with DeleteSync enabled.")
+        except Exception as e:
+            logger.error("ERROR: Could not process secret %s. Error: %s", secret_arn, e)
+
+    secret_values = fetch_secret_values([secret_arn for secret_arn, _ in secrets_with_targets])
+
+    for secret_arn, sync_targets in secrets_with_targets:
+        try:
+            if secret_arn in secret_values:
+                secret_name, secret_payload = secret_values[secret_arn]
+                
                 # Track managed secrets for cleanup
                 for account_id, region, delete_sync in sync_targets:
-                    target_accounts.add(account_id)
                     delete_sync_per_account[account_id] = delete_sync
-                    if account_id not in managed_secrets_per_account:
-                        managed_secrets_per_account[account_id] = set()
                     managed_secrets_per_account[account_id].add(secret_name)
                     
-                    if delete_sync:
-                        mark_secret_for_deletion(account_id, region, secret_name, describe_response, never_delete)
-                    else:
-                        print(f"     Skipping deletion sync for account {account_id} (DeleteSync disabled)")
-            else:
-                secret_response = secretsmanager.get_secret_value(SecretId=secret_arn)
-                secret_value = secret_response["SecretString"]
-                
-                # Track managed secrets for cleanup
+                    sync_tasks.append((account_id, region, secret_name, secret_payload, delete_sync))
+                continue
+
+            # No value came back, most likely because the secret is marked for deletion
+            describe_response = secretsmanager.describe_secret(SecretId=secret_arn)
+            secret_name = describe_response["Name"]
+            
+            if not describe_response.get("DeletedDate"):
+                logger.error("ERROR: Could not process secret %s. Error: secret value could not be retrieved.", secret_arn)
+                # Still managed: keep cleanup from deleting the copies it already has
                 for account_id, region, delete_sync in sync_targets:
-                    target_accounts.add(account_id)
-                    delete_sync_per_account[account_id] = delete_sync
-                    if account_id not in managed_secrets_per_account:
-                        managed_secrets_per_account[account_id] = set()
                     managed_secrets_per_account[account_id].add(secret_name)
-                    
-                    sync_to_single_account(account_id, region, secret_name, secret_value, delete_sync)
+                continue
+
+            logger.info("Secret '%s' is marked for deletion, syncing deletion state to targets with DeleteSync enabled.", secret_name)
+            # Track managed secrets for cleanup
+            for account_id, region, delete_sync in sync_targets:
+                delete_sync_per_account[account_id] = delete_sync
+                managed_secrets_per_account[account_id].add(secret_name)
+                
+                if delete_sync:
+                    deletion_tasks.append((account_id, region, secret_name, describe_response, never_delete))
+                else:
+                    logger.info("     Skipping deletion sync for account %s (DeleteSync disabled)", account_id)
 
         except Exception as e:
-            print(f"ERROR: Could not process secret {secret_arn}. Error: {e}")
+            logger.error("ERROR: Could not process secret %s. Error: %s", secret_arn, e)
+            incomplete_accounts.update(account_id for account_id, _, _ in sync_targets)
+
+    # Sync phase: every (secret, target) pair is independent network I/O
+    run_in_parallel(sync_to_single_account, sync_tasks)
+    run_in_parallel(mark_secret_for_deletion, deletion_tasks)
 
     # Cleanup phase: remove orphaned secrets (only for accounts with DeleteSync enabled)
-    for account_id in target_accounts:
-        if delete_sync_per_account.get(account_id, True):
-            managed_secrets = managed_secrets_per_account.get(account_id, set())
-            cleanup_orphaned_secrets(account_id, managed_secrets, never_delete)
+    cleanup_tasks = []
+    for account_id, managed_secrets in managed_secrets_per_account.items():
+        if account_id in incomplete_accounts:
+            logger.warning("Skipping cleanup for account %s: not every secret synced to it could be read.", account_id)
+        elif delete_sync_per_account.get(account_id, True):
+            cleanup_tasks.append((account_id, managed_secrets, never_delete))
         else:
-            print(f"Skipping cleanup for account {account_id} (DeleteSync disabled)")
+            logger.info("Skipping cleanup for account %s (DeleteSync disabled)", account_id)
+    run_in_parallel(cleanup_orphaned_secrets, cleanup_tasks)
 
     return {
         "statusCode": 200,
@@ -0,0 +1,103 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import app  # noqa: E402
+
+MANAGEMENT_ACCOUNT = "111111111111"
+TARGET_ACCOUNT = "222222222222"
+
+
+def tagged_secret(name, tags):
+    return {
+        "ResourceARN": f"arn:aws:secretsmanager:us-east-1:{MANAGEMENT_ACCOUNT}:secret:{name}-AbCdEf",
+        "Tags": [{"Key": key, "Value": value} for key, value in tags.items()],
+    }
+
+
+class LambdaHandlerTests(unittest.TestCase):
+    def setUp(self):
+        self.context = mock.Mock(invoked_function_arn=f"arn:aws:lambda:us-east-1:{MANAGEMENT_ACCOUNT}:function:secret-sync")
+        self.target_client = mock.Mock()
+        self.target_client.exceptions.ResourceNotFoundException = type("ResourceNotFoundException", (Exception,), {})
+        self.target_client.exceptions.InvalidRequestException = type("InvalidRequestException", (Exception,), {})
+        self.target_client.get_paginator.return_value.paginate.return_value = [
+            {"SecretList": [{"Name": "A"}, {"Name": "B"}]}
+        ]
+        self.tagging = mock.Mock()
+        source_client = mock.Mock()
+        source_client.batch_get_secret_value.side_effect = lambda SecretIdList: {
+            "SecretValues": [
+                {"ARN": arn, "Name": arn.split(":secret:")[1].rsplit("-", 1)[0], "SecretString": "value"}
+                for arn in SecretIdList
+            ]
+        }
+        for patcher in (
+            mock.patch.object(app, "get_config", return_value=None),
+            mock.patch.object(app, "get_target_client", return_value=self.target_client),
+            mock.patch.object(app, "tagging", self.tagging),
+            mock.patch.object(app, "secretsmanager", source_client),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def set_tagged_secrets(self, *resources):
+        def paginate(TagFilters, **kwargs):
+            tag_key = TagFilters[0]["Key"]
+            return [{"ResourceTagMappingList": [r for r in resources if any(t["Key"] == tag_key for t in r["Tags"])]}]
+        self.tagging.get_paginator.return_value.paginate.side_effect = paginate
+
+    def test_group_tags_without_config_abort_before_cleanup(self):
+        self.set_tagged_secrets(
+            tagged_secret("A", {app.TAG_SYNC_ACCOUNT: TARGET_ACCOUNT}),
+            tagged_secret("B", {app.TAG_SYNC_ACCOUNT: TARGET_ACCOUNT, app.TAG_SYNC_GROUP: "prod"}),
+        )
+
+        with self.assertRaises(ValueError):
+            app.lambda_handler({}, self.context)
+
+        self.target_client.put_secret_value.assert_not_called()
+        self.target_client.delete_secret.assert_not_called()
+
+    def test_group_only_secret_without_config_aborts_before_cleanup(self):
+        self.set_tagged_secrets(
+            tagged_secret("A", {app.TAG_SYNC_ACCOUNT: TARGET_ACCOUNT}),
+            tagged_secret("B", {app.TAG_SYNC_GROUP: "prod"}),
+        )
+
+        with self.assertRaises(ValueError):
+            app.lambda_handler({}, self.context)
+
+        self.target_client.delete_secret.assert_not_called()
+
+    def test_unreadable_secrets_are_not_cleaned_up(self):
+        self.set_tagged_secrets(*(
+            tagged_secret(f"S{i:02}", {app.TAG_SYNC_ACCOUNT: TARGET_ACCOUNT})
+            for i in range(app.BATCH_GET_SECRET_VALUE_LIMIT + 1)
+        ))
+        self.target_client.get_paginator.return_value.paginate.return_value = [
+            {"SecretList": [{"Name": f"S{i:02}"} for i in range(app.BATCH_GET_SECRET_VALUE_LIMIT + 1)]}
+        ]
+        read_batch = app.secretsmanager.batch_get_secret_value.side_effect
+        responses = iter([Exception("Throttled")])
+        def throttle_first_batch(SecretIdList):
+            error = next(responses, None)
+            if error:
+                raise error
+            return read_batch(SecretIdList)
+        app.secretsmanager.batch_get_secret_value.side_effect = throttle_first_batch
+        app.secretsmanager.describe_secret.side_effect = lambda SecretId: {"Name": SecretId.split(":secret:")[1].rsplit("-", 1)[0]}
+
+        app.lambda_handler({}, self.context)
+
+        readable_secret = f"S{app.BATCH_GET_SECRET_VALUE_LIMIT:02}"
+        self.target_client.put_secret_value.assert_called_once_with(SecretId=readable_secret, SecretString="value")
+        self.target_client.delete_secret.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()